@@ -1,23 +1,30 @@
+import threading
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 
 from compas.geometry import Bezier
+from compas.geometry import Box
 from compas.geometry import BrepEdge
 from compas.geometry import Circle
 from compas.geometry import Ellipse
+from compas.geometry import Frame
 from compas.geometry import Hyperbola
 from compas.geometry import Line
 from compas.geometry import NurbsCurve
 from compas.geometry import Parabola
 from compas.geometry import Point
+from OCC.Core import Bnd
+from OCC.Core import BndLib
+from OCC.Core import BRep
 from OCC.Core import BRepAdaptor
 from OCC.Core import BRepAlgo
 from OCC.Core import BRepBuilderAPI
 from OCC.Core import BRepGProp
 from OCC.Core import GProp
 from OCC.Core import TopAbs
-from OCC.Core import TopExp
 from OCC.Core import TopoDS
 
 from compas_occ.brep import OCCBrepVertex
@@ -26,15 +33,68 @@ from compas_occ.conversions import bspline_to_compas
 from compas_occ.conversions import circle_to_compas
 from compas_occ.conversions import circle_to_occ
 from compas_occ.conversions import ellipse_to_compas
+from compas_occ.conversions import ellipse_to_occ
 from compas_occ.conversions import hyperbola_to_compas
 from compas_occ.conversions import line_to_occ
 from compas_occ.conversions import parabola_to_compas
+from compas_occ.conversions import point_to_compas
 from compas_occ.conversions import point_to_occ
 from compas_occ.geometry import OCCCurve
 from compas_occ.geometry import OCCCurve2d
 from compas_occ.geometry import OCCNurbsCurve
 from compas_occ.geometry import OCCSurface
 
+_MakeEdge = BRepBuilderAPI.BRepBuilderAPI_MakeEdge
+_IsValid = BRepAlgo.brepalgo.IsValid
+_LinearProperties = BRepGProp.brepgprop.LinearProperties
+
+
+def _edge_ends(points=None, vertices=None) -> tuple:
+    # points take precedence over vertices if both are provided
+    if points:
+        return point_to_occ(points[0]), point_to_occ(points[1])
+    if vertices:
+        return vertices[0].occ_vertex, vertices[1].occ_vertex
+    return ()
+
+
+def _make_edge(geometry, surface=None, ends=(), params=None) -> TopoDS.TopoDS_Edge:
+    # the arguments follow the order of the `BRepBuilderAPI_MakeEdge` overloads:
+    # curve, optional surface, optional end points or vertices, optional parameters
+    args = [geometry]
+    if surface is not None:
+        args.append(surface)
+    args.extend(ends)
+    if params:
+        args.extend(params)
+    return _MakeEdge(*args).Edge()
+
+
+def _make_primitive_edge(geometry, params=None, points=None, vertices=None) -> TopoDS.TopoDS_Edge:
+    # the overloads for lines and conics do not combine end points with parameters,
+    # so params take precedence over points, and points over vertices
+    return _make_edge(geometry, ends=() if params else _edge_ends(points, vertices), params=params)
+
+
+# LinearProperties resets the props it is given before integrating,
+# so a single instance per thread can be reused for all length queries.
+_GPROPS_SCRATCH = threading.local()
+
+
+def _scratch_gprops() -> GProp.GProp_GProps:
+    props = getattr(_GPROPS_SCRATCH, "props", None)
+    if props is None:
+        props = _GPROPS_SCRATCH.props = GProp.GProp_GProps()
+    return props
+
+
+def _box_from_corners(cornermin, cornermax) -> Box:
+    # unlike `Box.from_diagonal`, this allows boxes without width, depth, or height,
+    # as is the case for the boxes of planar or axis aligned edges
+    xsize, ysize, zsize = [b - a for a, b in zip(cornermin, cornermax)]
+    point = [0.5 * (a + b) for a, b in zip(cornermin, cornermax)]
+    return Box(xsize, ysize, zsize, frame=Frame(point, [1, 0, 0], [0, 1, 0]))
+
 
 class CurveType:
     LINE = 0
@@ -48,6 +108,18 @@ class CurveType:
     CURVE2D = 8
 
 
+# conversion methods of `OCCBrepEdge.curve`, keyed by curve type
+_CURVE_CONVERSIONS = {
+    CurveType.LINE: "to_line",
+    CurveType.CIRCLE: "to_circle",
+    CurveType.ELLIPSE: "to_ellipse",
+    CurveType.HYPERBOLA: "to_hyperbola",
+    CurveType.PARABOLA: "to_parabola",
+    CurveType.BEZIER: "to_bezier",
+    CurveType.BSPLINE: "to_bspline",
+}
+
+
 class OCCBrepEdge(BrepEdge):
     """Class representing an edge in the BRep of a geometric shape.
 
@@ -91,8 +163,10 @@ class OCCBrepEdge(BrepEdge):
 
     @property
     def __data__(self):
+        start_vertex = self.first_vertex.__data__
+        end_vertex = self.last_vertex.__data__
         if self.is_line:
-            curve = self.to_line()
+            curve = Line(start_vertex["point"], end_vertex["point"])
         elif self.is_circle:
             curve = self.to_circle()
         elif self.is_ellipse:
@@ -107,8 +181,8 @@ class OCCBrepEdge(BrepEdge):
             "curve_type": self.type,
             "curve": curve.__data__,  # type: ignore
             "frame": curve.frame.__data__,  # type: ignore
-            "start_vertex": self.first_vertex.__data__,
-            "end_vertex": self.last_vertex.__data__,
+            "start_vertex": start_vertex,
+            "end_vertex": end_vertex,
             "domain": curve.domain,  # type: ignore
         }
 
@@ -123,7 +197,15 @@ class OCCBrepEdge(BrepEdge):
         self.is_2d = False
 
     def __eq__(self, other: "OCCBrepEdge"):
-        return self.is_equal(other)
+        if self is other:
+            return True
+        if not isinstance(other, OCCBrepEdge):
+            return False
+        return self._is_equal(other)
+
+    def __hash__(self):
+        # equal edges share the same TShape and Location, and therefore the same hash code
+        return self.occ_edge.HashCode(2147483647)
 
     def is_same(self, other: "OCCBrepEdge"):
         """Check if this edge is the same as another edge.
@@ -143,7 +225,7 @@ class OCCBrepEdge(BrepEdge):
         """
         if not isinstance(other, OCCBrepEdge):
             return False
-        return self.occ_edge.IsSame(other.occ_edge)
+        return self._is_same(other)
 
     def is_equal(self, other: "OCCBrepEdge"):
         """Check if this edge is equal to another edge.
@@ -163,7 +245,15 @@ class OCCBrepEdge(BrepEdge):
         """
         if not isinstance(other, OCCBrepEdge):
             return False
-        return self.occ_edge.IsEqual(other.occ_edge)
+        return self._is_equal(other)
+
+    # unchecked variants for callers that already know `other` is an edge
+
+    def _is_same(self, other: "OCCBrepEdge") -> bool:
+        return self._occ_edge.IsSame(other._occ_edge)
+
+    def _is_equal(self, other: "OCCBrepEdge") -> bool:
+        return self._occ_edge.IsEqual(other._occ_edge)
 
     # ==============================================================================
     # OCC Properties
@@ -179,14 +269,22 @@ class OCCBrepEdge(BrepEdge):
 
     @occ_edge.setter
     def occ_edge(self, edge: TopoDS.TopoDS_Edge) -> None:
+        if not isinstance(edge, TopoDS.TopoDS_Edge):
+            # shapes from explorers and iterators still need to be downcast
+            edge = TopoDS.topods.Edge(edge)
         self._occ_adaptor = None
-        self._curve = None
         self._nurbscurve = None  # remove this if possible
+        self._type = None
+        self._endpoints = None
+        self._vertices = None
+        self._length = None
+        self._domain = None
+        self._is_valid = None
         self._occ_edge = edge
 
     @property
     def occ_adaptor(self) -> BRepAdaptor.BRepAdaptor_Curve:
-        if not self._occ_adaptor:
+        if self._occ_adaptor is None:
             self._occ_adaptor = BRepAdaptor.BRepAdaptor_Curve(self.occ_edge)
         return self._occ_adaptor
 
@@ -194,13 +292,6 @@ class OCCBrepEdge(BrepEdge):
     def orientation(self) -> TopAbs.TopAbs_Orientation:
         return self.occ_edge.Orientation()
 
-    # @property
-    # def curve(self) -> OCCCurve:
-    #     if not self._curve:
-    #         occ_curve = self.occ_adaptor.Curve()
-    #         self._curve = OCCCurve(occ_curve)  # type: ignore
-    #     return self._curve
-
     # remove this if possible
     @property
     def nurbscurve(self) -> OCCNurbsCurve:
@@ -211,22 +302,10 @@ class OCCBrepEdge(BrepEdge):
 
     @property
     def curve(self):
-        if self.is_line:
-            return self.to_line()
-        if self.is_circle:
-            return self.to_circle()
-        if self.is_ellipse:
-            return self.to_ellipse()
-        if self.is_hyperbola:
-            return self.to_hyperbola()
-        if self.is_parabola:
-            return self.to_parabola()
-        if self.is_bezier:
-            return self.to_bezier()
-        if self.is_bspline:
-            return self.to_bspline()
-        print(self.type)
-        raise NotImplementedError
+        conversion = _CURVE_CONVERSIONS.get(self.type)
+        if conversion is None:
+            raise NotImplementedError(f"Curve type not supported: {self.type}")
+        return getattr(self, conversion)()
 
     # ==============================================================================
     # Properties
@@ -234,7 +313,9 @@ class OCCBrepEdge(BrepEdge):
 
     @property
     def type(self) -> int:
-        return self.occ_adaptor.GetType()
+        if self._type is None:
+            self._type = self.occ_adaptor.GetType()
+        return self._type
 
     @property
     def is_curve2d(self) -> bool:
@@ -274,40 +355,67 @@ class OCCBrepEdge(BrepEdge):
 
     @property
     def is_valid(self) -> bool:
-        return BRepAlgo.brepalgo.IsValid(self.occ_edge)
+        if self._is_valid is None:
+            self._is_valid = _IsValid(self.occ_edge)
+        return self._is_valid
 
     @property
     def vertices(self) -> List[OCCBrepVertex]:
-        vertices = []
-        explorer = TopExp.TopExp_Explorer(self.occ_edge, TopAbs.TopAbs_VERTEX)
-        while explorer.More():
-            vertex = explorer.Current()
-            vertices.append(OCCBrepVertex(vertex))  # type: ignore
-            explorer.Next()
-        return vertices
+        if self._vertices is None:
+            # the orientations of the vertices are combined with the orientation of the edge,
+            # like they would be by an explorer, unlike those of `first_vertex` and `last_vertex`
+            self._vertices = tuple(self._iter_occ_vertices())
+        # only the OCC vertices are cached,
+        # such that modifying the returned list or its vertices does not affect the edge
+        return [OCCBrepVertex(vertex) for vertex in self._vertices]
 
     @property
     def first_vertex(self) -> OCCBrepVertex:
-        return OCCBrepVertex(TopExp.topexp.FirstVertex(self.occ_edge))
+        return OCCBrepVertex(self._ensure_endpoints()[0])
 
     @property
     def last_vertex(self) -> OCCBrepVertex:
-        return OCCBrepVertex(TopExp.topexp.LastVertex(self.occ_edge))
+        return OCCBrepVertex(self._ensure_endpoints()[1])
 
     @property
     def length(self) -> float:
-        props = GProp.GProp_GProps()
-        BRepGProp.brepgprop.LinearProperties(self.occ_edge, props)
-        return props.Mass()
+        if self._length is None:
+            if self.is_line:
+                # lines are parametrized by arc length
+                first, last = self.domain
+                self._length = abs(last - first)
+            elif self.is_circle:
+                first, last = self.domain
+                # the adaptor also resolves circles of edges that only have a curve on a surface
+                self._length = self.occ_adaptor.Circle().Radius() * abs(last - first)
+            else:
+                props = _scratch_gprops()
+                _LinearProperties(self.occ_edge, props)
+                self._length = props.Mass()
+        return self._length
 
     @property
     def domain(self) -> Tuple[float, float]:
-        return self.occ_adaptor.FirstParameter(), self.occ_adaptor.LastParameter()
+        if self._domain is None:
+            first, last = BRep.BRep_Tool.Range(self.occ_edge)
+            self._domain = first, last
+        return self._domain
 
     # ==============================================================================
     # Constructors
     # ==============================================================================
 
+    @classmethod
+    def _from_built(cls, occ_edge: TopoDS.TopoDS_Edge, curve_type: Optional[int] = None) -> "OCCBrepEdge":
+        # `BRepBuilderAPI_MakeEdge.Edge()` raises if the builder is not done,
+        # so edges returned by it can be marked as valid without a topological check.
+        # the curve type is preset if the constructor already knows it.
+        edge = cls(occ_edge)
+        edge._is_valid = True
+        if curve_type is not None:
+            edge._type = curve_type
+        return edge
+
     @classmethod
     def from_vertex_vertex(cls, a: OCCBrepVertex, b: OCCBrepVertex) -> "OCCBrepEdge":
         """Construct an edge from two vertices.
@@ -325,8 +433,7 @@ class OCCBrepEdge(BrepEdge):
             The constructed edge.
 
         """
-        builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(a.occ_vertex, b.occ_vertex)
-        return cls(builder.Edge())
+        return cls._from_built(_MakeEdge(a.occ_vertex, b.occ_vertex).Edge(), CurveType.LINE)
 
     @classmethod
     def from_point_point(cls, a: Point, b: Point) -> "OCCBrepEdge":
@@ -345,8 +452,69 @@ class OCCBrepEdge(BrepEdge):
             The constructed edge.
 
         """
-        builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(point_to_occ(a), point_to_occ(b))
-        return cls(builder.Edge())
+        return cls._from_built(_MakeEdge(point_to_occ(a), point_to_occ(b)).Edge(), CurveType.LINE)
+
+    @classmethod
+    def from_point_pairs(cls, points_a: List[Point], points_b: List[Point]) -> List["OCCBrepEdge"]:
+        """Construct multiple edges from corresponding pairs of points.
+
+        Parameters
+        ----------
+        points_a : list[:class:`compas.geometry.Point`]
+            The start points of the edges.
+        points_b : list[:class:`compas.geometry.Point`]
+            The end points of the edges.
+
+        Returns
+        -------
+        list[:class:`~compas_occ.brep.BrepEdge`]
+            The constructed edges.
+
+        Raises
+        ------
+        ValueError
+            If the number of start and end points is not the same.
+
+        """
+        if len(points_a) != len(points_b):
+            raise ValueError("The number of start and end points should be the same.")
+
+        edges = []
+        for a, b in zip(points_a, points_b):
+            edges.append(cls._from_built(_MakeEdge(point_to_occ(a), point_to_occ(b)).Edge(), CurveType.LINE))
+        return edges
+
+    @classmethod
+    def from_point_point_shared(cls, a: Point, b: Point, vertex_cache: Dict[Tuple[float, float, float], TopoDS.TopoDS_Vertex]) -> "OCCBrepEdge":
+        """Construct an edge from two points, reusing the vertices of previously constructed edges.
+
+        Edges constructed with the same cache share the topological vertices at identical points,
+        which avoids having to sew or fuse coincident vertices afterwards.
+
+        Parameters
+        ----------
+        a : :class:`compas.geometry.Point`
+            The first point.
+        b : :class:`compas.geometry.Point`
+            The second point.
+        vertex_cache : dict[tuple[float, float, float], ``TopoDS.TopoDS_Vertex``]
+            A mapping of point coordinates to vertices.
+            Vertices that are not in the cache yet are added to it.
+
+        Returns
+        -------
+        :class:`~compas_occ.brep.BrepEdge`
+            The constructed edge.
+
+        """
+        vertices = []
+        for point in (a, b):
+            key = tuple(point)
+            vertex = vertex_cache.get(key)
+            if vertex is None:
+                vertex = vertex_cache[key] = BRepBuilderAPI.BRepBuilderAPI_MakeVertex(point_to_occ(point)).Vertex()
+            vertices.append(vertex)
+        return cls._from_built(_MakeEdge(vertices[0], vertices[1]).Edge(), CurveType.LINE)
 
     @classmethod
     def from_line(
@@ -375,23 +543,7 @@ class OCCBrepEdge(BrepEdge):
             The constructed edge.
 
         """
-        if params:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(line_to_occ(line), *params)
-        elif points:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(
-                line_to_occ(line),
-                point_to_occ(points[0]),
-                point_to_occ(points[1]),
-            )
-        elif vertices:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(
-                line_to_occ(line),
-                vertices[0].occ_vertex,
-                vertices[1].occ_vertex,
-            )
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(line_to_occ(line))
-        return cls(builder.Edge())
+        return cls._from_built(_make_primitive_edge(line_to_occ(line), params, points, vertices), CurveType.LINE)
 
     @classmethod
     def from_circle(
@@ -420,32 +572,28 @@ class OCCBrepEdge(BrepEdge):
             The constructed edge.
 
         """
-        if params:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(circle_to_occ(circle), *params)
-        elif points:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(
-                circle_to_occ(circle),
-                point_to_occ(points[0]),
-                point_to_occ(points[1]),
-            )
-        elif vertices:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(
-                circle_to_occ(circle),
-                vertices[0].occ_vertex,
-                vertices[1].occ_vertex,
-            )
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(circle_to_occ(circle))
-        return cls(builder.Edge())
+        return cls._from_built(_make_primitive_edge(circle_to_occ(circle), params, points, vertices), CurveType.CIRCLE)
 
     @classmethod
-    def from_ellipse(cls, ellipse: Ellipse) -> "OCCBrepEdge":
+    def from_ellipse(
+        cls,
+        ellipse: Ellipse,
+        params: Optional[Tuple[float, float]] = None,
+        points: Optional[Tuple[Point, Point]] = None,
+        vertices: Optional[Tuple[OCCBrepVertex, OCCBrepVertex]] = None,
+    ) -> "OCCBrepEdge":
         """Construct an edge from an ellipse.
 
         Parameters
         ----------
         ellipse : :class:`compas.geometry.Ellipse`
             The ellipse.
+        params : tuple of float, optional
+            The parameters of the ellipse.
+        points : tuple of :class:`compas.geometry.Point`, optional
+            The start and end points of the ellipse.
+        vertices : tuple of :class:`~compas_occ.brep.BrepVertex`, optional
+            The start and end vertices of the ellipse.
 
         Returns
         -------
@@ -453,7 +601,7 @@ class OCCBrepEdge(BrepEdge):
             The constructed edge.
 
         """
-        raise NotImplementedError
+        return cls._from_built(_make_primitive_edge(ellipse_to_occ(ellipse), params, points, vertices), CurveType.ELLIPSE)
 
     @classmethod
     def from_curve(
@@ -501,50 +649,20 @@ class OCCBrepEdge(BrepEdge):
             if not curve2d:
                 raise ValueError("No curve was provided.")
 
-            if points:
-                p1 = point_to_occ(points[0])
-                p2 = point_to_occ(points[1])
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface, p1, p2, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface, p1, p2)
-            elif vertices:
-                v1 = vertices[0].occ_vertex
-                v2 = vertices[1].occ_vertex
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface, v1, v2, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface, v1, v2)
-            else:
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve2d.occ_curve, surface.occ_surface)
+            occ_curve = curve2d.occ_curve
+            occ_surface = surface.occ_surface
         else:
             if not curve:
                 raise ValueError("No curve was provided.")
 
-            if points:
-                p1 = point_to_occ(points[0])
-                p2 = point_to_occ(points[1])
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve, p1, p2, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve, p1, p2)
-            elif vertices:
-                v1 = vertices[0].occ_vertex
-                v2 = vertices[1].occ_vertex
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve, v1, v2, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve, v1, v2)
-            else:
-                if params:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve, *params)
-                else:
-                    builder = BRepBuilderAPI.BRepBuilderAPI_MakeEdge(curve.occ_curve)
+            occ_curve = curve.occ_curve
+            occ_surface = None
 
-        return cls(builder.Edge())
+        occ_edge = _make_edge(occ_curve, occ_surface, _edge_ends(points, vertices), params)
+        if surface:
+            # without a 3D curve the edge is not guaranteed to be valid
+            return cls(occ_edge)
+        return cls._from_built(occ_edge)
 
     # ==============================================================================
     # Conversions
@@ -588,8 +706,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_circle:
             raise ValueError(f"The underlying geometry is not a circle: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        circle = curve.Circle()
+        circle = self.occ_adaptor.Circle()
         return circle_to_compas(circle)
 
     def to_ellipse(self) -> Ellipse:
@@ -609,8 +726,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_ellipse:
             raise ValueError(f"The underlying geometry is not an ellipse: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        ellipse = curve.Ellipse()
+        ellipse = self.occ_adaptor.Ellipse()
         return ellipse_to_compas(ellipse)
 
     def to_hyperbola(self) -> Hyperbola:
@@ -629,8 +745,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_hyperbola:
             raise ValueError(f"The underlying geometry is not a hyperbola: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        hyperbola = curve.Hyperbola()
+        hyperbola = self.occ_adaptor.Hyperbola()
         return hyperbola_to_compas(hyperbola)
 
     def to_parabola(self) -> Parabola:
@@ -649,8 +764,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_parabola:
             raise ValueError(f"The underlying geometry is not a parabola: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        parabola = curve.Parabola()
+        parabola = self.occ_adaptor.Parabola()
         return parabola_to_compas(parabola)
 
     def to_bezier(self) -> Bezier:
@@ -669,8 +783,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_bezier:
             raise ValueError(f"The underlying geometry is not a bezier: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        bezier = curve.Bezier()
+        bezier = self.occ_adaptor.Bezier()
         return bezier_to_compas(bezier)
 
     def to_bspline(self) -> NurbsCurve:
@@ -689,8 +802,7 @@ class OCCBrepEdge(BrepEdge):
         if not self.is_bspline:
             raise ValueError(f"The underlying geometry is not a bspline: {self.type}")
 
-        curve = self.occ_adaptor.Curve()
-        bspline = curve.BSpline()
+        bspline = self.occ_adaptor.BSpline()
         return bspline_to_compas(bspline)
 
     # # remove this if possible
@@ -708,6 +820,97 @@ class OCCBrepEdge(BrepEdge):
     # Methods
     # ==============================================================================
 
+    def aabb(self, precision: float = 0.0) -> Box:
+        """Compute the axis aligned bounding box of the edge.
+
+        Parameters
+        ----------
+        precision : float, optional
+
+        Returns
+        -------
+        :class:`~compas.geometry.Box`
+
+        """
+        if self.is_line:
+            first, last = self._ensure_endpoints()
+            if not first.IsNull() and not last.IsNull():
+                # the box of a line segment is spanned by its end points
+                a = point_to_compas(BRep.BRep_Tool.Pnt(first))
+                b = point_to_compas(BRep.BRep_Tool.Pnt(last))
+                cornermin = [min(u, v) - precision for u, v in zip(a, b)]
+                cornermax = [max(u, v) + precision for u, v in zip(a, b)]
+                return _box_from_corners(cornermin, cornermax)
+
+        box = Bnd.Bnd_Box()
+        BndLib.BndLib_Add3dCurve.Add(self.occ_adaptor, precision, box)
+        return _box_from_corners(point_to_compas(box.CornerMin()), point_to_compas(box.CornerMax()))
+
+    def _ensure_endpoints(self) -> Tuple[TopoDS.TopoDS_Vertex, TopoDS.TopoDS_Vertex]:
+        # same selection as topexp.FirstVertex and topexp.LastVertex,
+        # but both vertices are found in a single pass over the edge
+        if self._endpoints is None:
+            first = last = None
+            it = TopoDS.TopoDS_Iterator(self.occ_edge, False)
+            while it.More():
+                vertex = it.Value()
+                orientation = vertex.Orientation()
+                if first is None and orientation == TopAbs.TopAbs_FORWARD:
+                    first = TopoDS.topods.Vertex(vertex)
+                elif last is None and orientation == TopAbs.TopAbs_REVERSED:
+                    last = TopoDS.topods.Vertex(vertex)
+                it.Next()
+            self._endpoints = (
+                first if first is not None else TopoDS.TopoDS_Vertex(),
+                last if last is not None else TopoDS.TopoDS_Vertex(),
+            )
+        return self._endpoints
+
+    def iter_vertices(self) -> Iterator[OCCBrepVertex]:
+        """Iterate over the topological vertices of the edge.
+
+        Yields
+        ------
+        :class:`~compas_occ.brep.BrepVertex`
+
+        """
+        for vertex in self._iter_occ_vertices():
+            yield OCCBrepVertex(vertex)
+
+    def _iter_occ_vertices(self) -> Iterator[TopoDS.TopoDS_Vertex]:
+        # the vertices are direct children of the edge,
+        # so there is no need for the recursive descent of an explorer.
+        # like an explorer, the iterator combines their orientations with that of the edge.
+        it = TopoDS.TopoDS_Iterator(self.occ_edge, True)
+        while it.More():
+            yield TopoDS.topods.Vertex(it.Value())
+            it.Next()
+
+    @classmethod
+    def total_length(cls, shape: TopoDS.TopoDS_Shape, skip_shared: bool = False) -> float:
+        """Compute the combined length of all edges of a shape.
+
+        The edges are integrated by OCC in a single pass,
+        without wrapping each of them in an edge object.
+
+        Parameters
+        ----------
+        shape : ``TopoDS.TopoDS_Shape``
+            An OCC shape.
+        skip_shared : bool, optional
+            If True, edges shared by multiple faces are counted only once.
+            Otherwise, every edge found by exploring the shape is counted,
+            which is the same as summing the lengths of the edges of :attr:`OCCBrep.edges`.
+
+        Returns
+        -------
+        float
+
+        """
+        props = _scratch_gprops()
+        _LinearProperties(shape, props, skip_shared)
+        return props.Mass()
+
     # def try_get_nurbscurve(
     #     self,
     #     precision=1e-3,
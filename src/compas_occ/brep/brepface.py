@@ -41,6 +41,15 @@ from compas_occ.conversions import torus_to_occ
 from compas_occ.geometry import OCCNurbsSurface
 from compas_occ.geometry import OCCSurface
 
+_MakeFace = BRepBuilderAPI.BRepBuilderAPI_MakeFace
+
+
+def _make_face(geometry, loop=None, inside=True) -> TopoDS.TopoDS_Face:
+    # face from an OCC elementary surface, optionally bounded by a loop
+    if loop:
+        return _MakeFace(geometry, loop.occ_wire, inside).Face()
+    return _MakeFace(geometry).Face()
+
 
 class OCCBrepFace(BrepFace):
     """
@@ -164,11 +173,14 @@ class OCCBrepFace(BrepFace):
         self._occ_adaptor = None
         self._surface = None
         self._nurbssurface = None
+        self._vertices = None
+        self._edges = None
+        self._loops = None
         self._occ_face = face
 
     @property
     def occ_adaptor(self) -> BRepAdaptor.BRepAdaptor_Surface:
-        if not self._occ_adaptor:
+        if self._occ_adaptor is None:
             self._occ_adaptor = BRepAdaptor.BRepAdaptor_Surface(self.occ_face)
         return self._occ_adaptor
 
@@ -187,7 +199,7 @@ class OCCBrepFace(BrepFace):
     # remove this if possible
     @property
     def nurbssurface(self) -> OCCNurbsSurface:
-        if not self._nurbssurface:
+        if self._nurbssurface is None:
             occ_surface = self.occ_adaptor.BSpline()
             self._nurbssurface = OCCNurbsSurface(occ_surface)
         return self._nurbssurface
@@ -248,33 +260,39 @@ class OCCBrepFace(BrepFace):
 
     @property
     def vertices(self) -> List[OCCBrepVertex]:
-        vertices = []
-        explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_VERTEX)
-        while explorer.More():
-            vertex = explorer.Current()
-            vertices.append(OCCBrepVertex(vertex))  # type: ignore
-            explorer.Next()
-        return vertices
+        if self._vertices is None:
+            vertices = []
+            explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_VERTEX)
+            while explorer.More():
+                vertex = explorer.Current()
+                vertices.append(OCCBrepVertex(vertex))  # type: ignore
+                explorer.Next()
+            self._vertices = vertices
+        return self._vertices
 
     @property
     def edges(self) -> List[OCCBrepEdge]:
-        edges = []
-        explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_EDGE)
-        while explorer.More():
-            edge = explorer.Current()
-            edges.append(OCCBrepEdge(edge))  # type: ignore
-            explorer.Next()
-        return edges
+        if self._edges is None:
+            edges = []
+            explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_EDGE)
+            while explorer.More():
+                edge = explorer.Current()
+                edges.append(OCCBrepEdge(edge))  # type: ignore
+                explorer.Next()
+            self._edges = edges
+        return self._edges
 
     @property
     def loops(self) -> List[OCCBrepLoop]:
-        loops = []
-        explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_WIRE)
-        while explorer.More():
-            wire = explorer.Current()
-            loops.append(OCCBrepLoop(wire))  # type: ignore
-            explorer.Next()
-        return loops
+        if self._loops is None:
+            loops = []
+            explorer = TopExp.TopExp_Explorer(self.occ_face, TopAbs.TopAbs_WIRE)
+            while explorer.More():
+                wire = explorer.Current()
+                loops.append(OCCBrepLoop(wire))  # type: ignore
+                explorer.Next()
+            self._loops = loops
+        return self._loops
 
     @property
     def outerloop(self) -> OCCBrepLoop:
@@ -370,12 +388,8 @@ class OCCBrepFace(BrepFace):
         if domain_u and domain_v:
             min_u, max_u = domain_u
             min_v, max_v = domain_v
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(occ_plane, min_u, max_u, min_v, max_v)
-        elif loop:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(occ_plane, loop.occ_wire, inside)
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(occ_plane)
-        return cls(builder.Face())
+            return cls(_MakeFace(occ_plane, min_u, max_u, min_v, max_v).Face())
+        return cls(_make_face(occ_plane, loop, inside))
 
     @classmethod
     def from_cylinder(
@@ -401,15 +415,7 @@ class OCCBrepFace(BrepFace):
         :class:`OCCBrepFace`
 
         """
-        if loop:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(
-                cylinder_to_occ(cylinder),
-                loop.occ_wire,
-                inside,
-            )
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(cylinder_to_occ(cylinder))
-        return cls(builder.Face())
+        return cls(_make_face(cylinder_to_occ(cylinder), loop, inside))
 
     @classmethod
     def from_cone(
@@ -435,15 +441,7 @@ class OCCBrepFace(BrepFace):
         :class:`OCCBrepFace`
 
         """
-        if loop:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(
-                cone_to_occ(cone),
-                loop.occ_wire,
-                inside,
-            )
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(cone_to_occ(cone))
-        return cls(builder.Face())
+        return cls(_make_face(cone_to_occ(cone), loop, inside))
 
     @classmethod
     def from_sphere(
@@ -469,11 +467,7 @@ class OCCBrepFace(BrepFace):
         :class:`OCCBrepFace`
 
         """
-        if loop:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(sphere_to_occ(sphere), loop.occ_wire, inside)
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(sphere_to_occ(sphere))
-        return cls(builder.Face())
+        return cls(_make_face(sphere_to_occ(sphere), loop, inside))
 
     @classmethod
     def from_torus(
@@ -499,11 +493,7 @@ class OCCBrepFace(BrepFace):
         :class:`OCCBrepFace`
 
         """
-        if loop:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(torus_to_occ(torus), loop.occ_wire, inside)
-        else:
-            builder = BRepBuilderAPI.BRepBuilderAPI_MakeFace(torus_to_occ(torus))
-        return cls(builder.Face())
+        return cls(_make_face(torus_to_occ(torus), loop, inside))
 
     @classmethod
     def from_surface(
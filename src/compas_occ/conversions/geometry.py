@@ -1002,9 +1002,7 @@ def circle_to_compas(
 
     """
     cls = cls or Circle
-    point = point_to_compas(circ.Location())
     frame = ax2_to_compas(circ.Position())
-    frame.point = point
     radius = circ.Radius()
     return cls(radius, frame=frame)
 
@@ -1041,9 +1039,7 @@ def ellipse_to_compas(
 
     """
     cls = cls or Ellipse
-    point = point_to_compas(elips.Location())
     frame = ax2_to_compas(elips.Position())
-    frame.point = point
     major = elips.MajorRadius()
     minor = elips.MinorRadius()
     return cls(major, minor, frame=frame)
@@ -1071,9 +1067,7 @@ def hyperbola_to_compas(hypr: gp_Hypr) -> Hyperbola:
     Hyperbola(major=1.0, minor=0.5, frame=Frame(...))
 
     """
-    point = point_to_compas(hypr.Location())
     frame = ax2_to_compas(hypr.Position())
-    frame.point = point
     major = hypr.MajorRadius()
     minor = hypr.MinorRadius()
     return Hyperbola(major, minor, frame=frame)
@@ -1101,9 +1095,7 @@ def parabola_to_compas(parab: gp_Parab) -> Parabola:
     Parabola(focal=2.0, frame=Frame(...))
 
     """
-    point = point_to_compas(parab.Location())
     frame = ax2_to_compas(parab.Position())
-    frame.point = point
     length = parab.Parameter()
     return Parabola(length, frame=frame)
 
@@ -0,0 +1,167 @@
+import math
+import pytest
+from compas.geometry import Box
+from compas.geometry import Circle
+from compas.geometry import Ellipse
+from compas.geometry import Frame
+from compas.geometry import Point
+from OCC.Core import TopAbs
+from OCC.Core import TopExp
+from compas_occ.brep import OCCBrep
+from compas_occ.brep import OCCBrepEdge
+from compas_occ.brep import OCCBrepVertex
+
+
+def test_edge_aabb_planar_line():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 2, 0))
+    box = edge.aabb()
+
+    assert box.xsize == pytest.approx(1.0)
+    assert box.ysize == pytest.approx(2.0)
+    assert box.zsize == pytest.approx(0.0)
+    assert list(box.frame.point) == pytest.approx([0.5, 1.0, 0.0])
+
+
+def test_edge_aabb_axis_aligned_line():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 1), Point(3, 0, 1))
+    box = edge.aabb(precision=0.1)
+
+    assert box.xsize == pytest.approx(3.2)
+    assert box.ysize == pytest.approx(0.2)
+    assert box.zsize == pytest.approx(0.2)
+    assert list(box.frame.point) == pytest.approx([1.5, 0.0, 1.0])
+
+
+def test_edge_aabb_circle():
+    edge = OCCBrepEdge.from_circle(Circle(1.0, frame=Frame.worldXY()))
+    box = edge.aabb()
+
+    assert box.xsize == pytest.approx(2.0, abs=1e-3)
+    assert box.ysize == pytest.approx(2.0, abs=1e-3)
+    assert box.zsize == pytest.approx(0.0, abs=1e-3)
+    assert list(box.frame.point) == pytest.approx([0.0, 0.0, 0.0], abs=1e-3)
+
+
+def test_edge_length_circle():
+    edge = OCCBrepEdge.from_circle(Circle(2.0, frame=Frame.worldXY()), params=(0, math.pi))
+
+    assert edge.length == pytest.approx(2.0 * math.pi)
+
+
+def test_edge_vertices_orientation():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    reversed_edge = OCCBrepEdge(edge.occ_edge.Reversed())
+
+    explorer = TopExp.TopExp_Explorer(reversed_edge.occ_edge, TopAbs.TopAbs_VERTEX)
+    expected = []
+    while explorer.More():
+        expected.append(OCCBrepVertex(explorer.Current()))
+        explorer.Next()
+
+    assert reversed_edge.vertices == expected
+    assert list(reversed_edge.iter_vertices()) == expected
+
+
+def test_edge_vertices_are_not_shared():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+
+    edge.vertices.clear()
+    assert len(edge.vertices) == 2
+
+    edge.first_vertex.point = Point(5, 5, 5)
+    assert list(edge.first_vertex.point) == pytest.approx([0.0, 0.0, 0.0])
+    assert list(edge.to_line().start) == pytest.approx([0.0, 0.0, 0.0])
+
+
+def test_edge_from_point_pairs():
+    edges = OCCBrepEdge.from_point_pairs([Point(0, 0, 0), Point(0, 1, 0)], [Point(1, 0, 0), Point(0, 3, 0)])
+
+    assert len(edges) == 2
+    assert all(edge.is_line for edge in edges)
+    assert edges[0].length == pytest.approx(1.0)
+    assert edges[1].length == pytest.approx(2.0)
+
+
+def test_edge_from_point_pairs_length_mismatch():
+    with pytest.raises(ValueError):
+        OCCBrepEdge.from_point_pairs([Point(0, 0, 0), Point(0, 1, 0)], [Point(1, 0, 0)])
+
+
+def test_edge_to_circle():
+    edge = OCCBrepEdge.from_circle(Circle(2.0, frame=Frame.worldXY()))
+    circle = edge.to_circle()
+
+    assert circle.radius == pytest.approx(2.0)
+    assert list(circle.frame.point) == pytest.approx([0.0, 0.0, 0.0])
+    assert edge.__data__["curve"]["radius"] == pytest.approx(2.0)
+
+
+def test_edge_from_point_point_shared():
+    cache = {}
+    a = OCCBrepEdge.from_point_point_shared(Point(0, 0, 0), Point(1, 0, 0), cache)
+    b = OCCBrepEdge.from_point_point_shared(Point(1, 0, 0), Point(1, 1, 0), cache)
+
+    assert len(cache) == 3
+    assert a.last_vertex.occ_vertex.IsSame(b.first_vertex.occ_vertex)
+    assert not a.first_vertex.occ_vertex.IsSame(b.last_vertex.occ_vertex)
+
+
+def test_edge_from_ellipse():
+    edge = OCCBrepEdge.from_ellipse(Ellipse(2.0, 1.0, frame=Frame.worldXY()))
+
+    assert edge.is_ellipse
+    ellipse = edge.to_ellipse()
+    assert ellipse.major == pytest.approx(2.0)
+    assert ellipse.minor == pytest.approx(1.0)
+
+
+def test_edge_total_length():
+    brep = OCCBrep.from_box(Box(1.0))
+
+    assert OCCBrepEdge.total_length(brep.occ_shape) == pytest.approx(sum(edge.length for edge in brep.edges))
+    assert OCCBrepEdge.total_length(brep.occ_shape, skip_shared=True) == pytest.approx(12.0)
+
+
+def test_edge_iter_vertices():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    vertices = list(edge.iter_vertices())
+
+    assert len(vertices) == 2
+    assert vertices == edge.vertices
+
+
+def test_edge_hash_and_eq():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    same = OCCBrepEdge(edge.occ_edge)
+    other = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+
+    assert edge == same
+    assert hash(edge) == hash(same)
+    assert edge != other
+    assert len({edge, same, other}) == 2
+    assert edge != "edge"
+
+
+def test_edge_length_follows_occ_edge():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    assert edge.length == pytest.approx(1.0)
+
+    edge.occ_edge = OCCBrepEdge.from_circle(Circle(1.0, frame=Frame.worldXY())).occ_edge
+    assert edge.length == pytest.approx(2 * math.pi)
+
+
+def test_edge_domain_follows_occ_edge():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    assert edge.domain == pytest.approx((0.0, 1.0))
+
+    edge.occ_edge = OCCBrepEdge.from_circle(Circle(1.0, frame=Frame.worldXY())).occ_edge
+    assert edge.domain == pytest.approx((0.0, 2 * math.pi))
+
+
+def test_edge_is_valid_follows_occ_edge():
+    edge = OCCBrepEdge.from_point_point(Point(0, 0, 0), Point(1, 0, 0))
+    assert edge.is_valid
+
+    edge.occ_edge = OCCBrepEdge.from_circle(Circle(1.0, frame=Frame.worldXY())).occ_edge
+    assert edge._is_valid is None
+    assert edge.is_valid
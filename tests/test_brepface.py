@@ -0,0 +1,21 @@
+from compas.geometry import Plane
+from compas_occ.brep import OCCBrepFace
+
+
+def test_face_subshapes_are_cached():
+    face = OCCBrepFace.from_plane(Plane.worldXY(), domain_u=(0, 1), domain_v=(0, 1))
+
+    assert len(face.edges) == 4
+    assert len(face.loops) == 1
+    assert face.edges is face.edges
+    assert face.vertices is face.vertices
+
+
+def test_face_subshapes_follow_occ_face():
+    face = OCCBrepFace.from_plane(Plane.worldXY(), domain_u=(0, 1), domain_v=(0, 1))
+    edges = face.edges
+
+    face.occ_face = OCCBrepFace.from_plane(Plane.worldXY(), domain_u=(0, 2), domain_v=(0, 2)).occ_face
+
+    assert face.edges is not edges
+    assert len(face.edges) == 4